@@ -5,11 +5,16 @@ import finnhub
 import yfinance as yf
 import pandas as pd
 import requests
+import threading
+import time
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Callable
 from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
 
-from stockchart.utils import date_utils
+from stockchart.utils import date_utils, disk_cache
 
 try: 
     load_dotenv()
@@ -19,6 +24,50 @@ except ImportError:
     FINNHUB_API_KEY = None
     ALPHA_VANTAGE_API_KEY = None
 
+FINNHUB_CALLS_PER_SECOND = 25
+CACHE_EXPIRY_S = 24 * 60 * 60
+HTTP_TIMEOUT_S = (3, 10) # (connect, read)
+FINNHUB_MAX_INFLIGHT = 8
+FINNHUB_RESULT_CAP = 250 # Default for responses of this size being treated as truncated, the page size differs by endpoint
+FETCHER_WORKERS = 8
+HTTP_POOL_SIZE = FETCHER_WORKERS + FINNHUB_MAX_INFLIGHT # One connection per thread that can be mid-request
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+PRICE_DTYPES = {'Open': 'float32', 'High': 'float32', 'Low': 'float32', 'Close': 'float32'}
+
+class RateLimiter:
+    """Spaces out calls (across threads) to stay within a calls/ second limit."""
+    def __init__(self, calls_per_second: int):
+        self._interval = 1.0 / calls_per_second
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Blocks until the next call slot is available."""
+        with self._lock:
+            current = time.monotonic()
+            delay = self._next_call - current
+            self._next_call = max(current, self._next_call) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+# Shared by all fetchers, as the limit applies per API key
+finnhub_rate_limiter = RateLimiter(calls_per_second=FINNHUB_CALLS_PER_SECOND)
+
+def mount_pooled_adapter(session: requests.Session) -> requests.Session:
+    """Sizes the session's connection pool for the fetcher's threads, and retries transient errors."""
+    session.mount("https://", HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+@lru_cache(maxsize=None)
+def get_yf_ticker(ticker: str) -> yf.Ticker:
+    """Returns a shared yfinance Ticker, so that its resolved metadata and session are reused."""
+    return yf.Ticker(ticker)
+
 class DataFetcher:
     """Handles data fetching from APIs"""
     def __init__(self, ticker: str = "NVDA", range: int = 90):
@@ -29,58 +78,87 @@ class DataFetcher:
         self.end_date = date_utils.now()
         self.start_date = date_utils.backdate(past_days_ago=range)
 
-        # API Clients
+        # Formatted once, as they are reused by every request
+        self.start_date_str = date_utils.get_date(self.start_date)
+        self.end_date_str = date_utils.get_date(self.end_date)
+        self.start_iso = date_utils.get_ISO_date_time(self.start_date)
+
+        # API Clients, their sessions keep connections warm across requests.
+        # The Finnhub client's default pool (10) is smaller than the number of threads calling it concurrently.
         self.finnhub_client = finnhub.Client(api_key=FINNHUB_API_KEY)
+        mount_pooled_adapter(self.finnhub_client._session)
+        self._http = mount_pooled_adapter(requests.Session())
+
+        # Long-lived pools, so that the returned futures actually run concurrently.
+        # Batches get their own pool, as the endpoint tasks block on them (sharing one pool could deadlock).
+        self._executor = ThreadPoolExecutor(max_workers=FETCHER_WORKERS, thread_name_prefix="fetcher")
+        self._batch_executor = ThreadPoolExecutor(max_workers=FINNHUB_MAX_INFLIGHT, thread_name_prefix="finnhub-batch")
     
     def fetch_logo_async(self) -> Future:
-        """Submits the ticker icon fetching task to a thread pool."""
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            return executor.submit(self._get_ticker_icon)
+        """Submits the ticker icon fetching task to the thread pool."""
+        return self._executor.submit(self._get_ticker_icon)
     
     def fetch_price_async(self) -> Future:
-        """Submits the price fetching task to a thread pool."""
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            return executor.submit(self._get_price_history)
+        """Submits the price fetching task to the thread pool."""
+        return self._executor.submit(self._get_price_history)
 
     def fetch_events_async(self) -> Dict[str, Future]:
-        """Submits all event fetching tasks to a thread pool."""
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {
-                'macro_news': executor.submit(self._get_macro_news),
-                'company_news': executor.submit(
-                    self._fetch_all_from_finnhub_endpoint,
-                    self.finnhub_client.company_news,
-                    symbol=self.ticker,
-                    batch_size=5
-                ),
-                'filings': executor.submit(
-                    self._fetch_all_from_finnhub_endpoint,
-                    self.finnhub_client.filings,
-                    symbol=self.ticker,
-                    batch_size=30
-                ),
-                'insider_transactions': executor.submit(
-                    self._fetch_all_from_finnhub_endpoint,
-                    self.finnhub_client.stock_insider_transactions,
-                    symbol=self.ticker,
-                    batch_size=30
-                )
-            }
-        return futures
+        """Submits all event fetching tasks to the thread pool."""
+        return {
+            'macro_news': self._executor.submit(self._get_macro_news),
+            'company_news': self._executor.submit(
+                self._fetch_all_from_finnhub_endpoint,
+                self.finnhub_client.company_news,
+                symbol=self.ticker,
+                batch_size=5,
+                result_cap=250
+            ),
+            'filings': self._executor.submit(
+                self._fetch_all_from_finnhub_endpoint,
+                self.finnhub_client.filings,
+                symbol=self.ticker,
+                batch_size=30,
+                result_cap=250
+            ),
+            'insider_transactions': self._executor.submit(
+                self._fetch_all_from_finnhub_endpoint,
+                self.finnhub_client.stock_insider_transactions,
+                symbol=self.ticker,
+                batch_size=30,
+                result_cap=100
+            )
+        }
+
+    def close(self) -> None:
+        """Shuts down the thread pools and closes the HTTP sessions."""
+        self._executor.shutdown(wait=False)
+        self._batch_executor.shutdown(wait=False)
+        self._http.close()
+        self.finnhub_client.close()
+
+    def __del__(self):
+        for name in ('_executor', '_batch_executor'):
+            executor = getattr(self, name, None)
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     # yfinance
     def _get_price_history(self) -> pd.DataFrame:
         """Fetches the last 3 months of daily stock prices."""
         try:
-            stock = yf.Ticker(self.ticker)
-            history = stock.history(
-                start=date_utils.get_date(self.start_date),
-                end=date_utils.get_date(self.end_date)
+            history = self._request_price_history(
+                self.ticker,
+                self.start_date_str,
+                self.end_date_str
             )
-            return history
+            # Prices at the precision Plotly renders them
+            return pd.DataFrame(
+                {column: history[column] for column in PRICE_COLUMNS},
+                index=pd.DatetimeIndex(history['Date'], name='Date')
+            ).astype(PRICE_DTYPES)
         except Exception as e:
             print(f"Error fetching yFinance price history: {e}")
-            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits'])
+            return pd.DataFrame(columns=PRICE_COLUMNS).astype(PRICE_DTYPES)
     
     # Alpha Vantage
     def _get_macro_news(self) -> Dict[str, Any]:
@@ -90,13 +168,13 @@ class DataFetcher:
             f"function=NEWS_SENTIMENT&"
             f"topics=economy_macro&"
             f"sort=RELEVANCE&"
-            f"time_from={date_utils.get_ISO_date_time(self.start_date)}&"
+            f"time_from={self.start_iso}&"
             f"limit=1000&"
             f"apikey={ALPHA_VANTAGE_API_KEY}"
         )
 
         try:
-            r = requests.get(url)
+            r = self._http.get(url, timeout=HTTP_TIMEOUT_S)
             r.raise_for_status() # Raise an exception for bad status codes
             data = r.json()
             return data
@@ -105,38 +183,118 @@ class DataFetcher:
             return {}
 
     # Finnhub
-    def _fetch_all_from_finnhub_endpoint(self, api_endpoint: Callable, batch_size: int = 7, **kwargs) -> List[Dict[str, Any]]:
+    def _fetch_all_from_finnhub_endpoint(self, api_endpoint: Callable, batch_size: int = 7, result_cap: int = FINNHUB_RESULT_CAP, **kwargs) -> List[Dict[str, Any]]:
         """
-        Orchestrates multiple API calls for a given finnhub endpoint in batches. 
+        Orchestrates API calls for a given finnhub endpoint. The whole window is requested at once first,
+        splitting any window whose response looks truncated in half. Falls back to batches (fetched concurrently) if a request fails.
         Note: Finnhub has a current API limit of 25 calls/ second
         
         Args:
             api_endpoint (Callable): The Finnhub client method to call (e.g., self.finnhub_client.company_news).
+            result_cap (int): The endpoint's maximum number of results per call, responses of this size are treated as truncated.
             **kwargs: Keyword arguments to pass to the API endpoint method (e.g., symbol='AAPL').
         """
+        try:
+            return self._fetch_finnhub_windows(api_endpoint, result_cap, **kwargs)
+        except Exception as e:
+            print(f"Error fetching data for {api_endpoint.__name__} from {self.start_date_str} to {self.end_date_str}: {e}. Fetching in batches.")
+
         all_data = []
         date_ranges = date_utils.get_dates_in_range(start_date=self.start_date, end_date=self.end_date, batch_size=batch_size)
-        for from_date, to_date in date_ranges:
-            try:
-                batch_data = api_endpoint(_from=from_date, to=to_date, **kwargs)
-
-                # For insider transactions endpoint, as it returns a dict -> Cannot extend!
-                if isinstance(batch_data, dict) and 'data' in batch_data and isinstance(batch_data['data'], list):
-                    all_data.extend(batch_data['data'])
-                # default for most endpoints 
-                elif isinstance(batch_data, list):
-                    all_data.extend(batch_data)
-            except Exception as e:
-                print(f"Error fetching data for {api_endpoint.__name__} from {from_date} to {to_date}: {e}")
+        futures = [
+            self._batch_executor.submit(self._fetch_finnhub_batch, api_endpoint, from_date, to_date, **kwargs)
+            for from_date, to_date in date_ranges
+        ]
+        # Collected in submission order to keep the batches in reverse chronological order
+        for future in futures:
+            all_data.extend(future.result())
+        return all_data
+
+    def _fetch_finnhub_windows(self, api_endpoint: Callable, result_cap: int, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Fetches the whole window from a given finnhub endpoint, then refetches the halves of any window whose response
+        looks truncated (concurrently, one level at a time) until each is complete or a single day. Raises if any request fails.
+        """
+        windows = [(self.start_date_str, self.end_date_str)]
+        data_by_window = {}
+        while windows:
+            futures = [
+                (window, self._batch_executor.submit(self._request_finnhub_batch, api_endpoint, *window, **kwargs))
+                for window in windows
+            ]
+            windows = []
+            for window, future in futures:
+                data = self._unwrap_finnhub_data(future.result())
+                halves = date_utils.split_date_range(*window) if len(data) >= result_cap else [window]
+                if len(halves) > 1:
+                    print(f"{api_endpoint.__name__} returned {len(data)} results from {window[0]} to {window[1]}, the response is likely truncated. Splitting the range.")
+                    windows.extend(halves)
+                else:
+                    data_by_window[window] = data
+
+        # Reverse chronological order, like the batches
+        all_data = []
+        for window in sorted(data_by_window, reverse=True):
+            all_data.extend(data_by_window[window])
         return all_data
+
+    def _fetch_finnhub_batch(self, api_endpoint: Callable, from_date: str, to_date: str, **kwargs) -> List[Dict[str, Any]]:
+        """Fetches a single batch from a given finnhub endpoint."""
+        try:
+            return self._unwrap_finnhub_data(
+                self._request_finnhub_batch(api_endpoint, from_date, to_date, **kwargs)
+            )
+        except Exception as e:
+            print(f"Error fetching data for {api_endpoint.__name__} from {from_date} to {to_date}: {e}")
+        return []
+
+    @staticmethod
+    def _unwrap_finnhub_data(batch_data: Any) -> List[Dict[str, Any]]:
+        """Returns the list of records in a finnhub response."""
+        # For insider transactions endpoint, as it returns a dict -> Cannot extend!
+        if isinstance(batch_data, dict) and 'data' in batch_data and isinstance(batch_data['data'], list):
+            return batch_data['data']
+        # default for most endpoints 
+        elif isinstance(batch_data, list):
+            return batch_data
+        return []
+
+    # Cacheable requests: only take immutable arguments, with the dates supplied by the caller.
+    # Ranges reaching today are not cached, so that today's partial data is not frozen.
+
+    @staticmethod
+    @disk_cache.memoize(
+        expire=CACHE_EXPIRY_S,
+        bypass=lambda ticker, from_date, to_date: to_date > date_utils.get_date() # yfinance's end date is exclusive
+    )
+    def _request_price_history(ticker: str, from_date: str, to_date: str) -> Dict[str, List[Any]]:
+        """Requests the daily stock prices within a date range, as plain columns (only those the chart needs) for the JSON cache."""
+        history = get_yf_ticker(ticker).history(start=from_date, end=to_date)
+        # yfinance hides request errors behind an empty frame, raised here so that it is not cached
+        if history.empty:
+            raise ValueError(f"No price history returned for {ticker} from {from_date} to {to_date}")
+        # Daily bars, so the exchange's local date is all the index needs
+        columns = {column: history[column].tolist() for column in PRICE_COLUMNS}
+        columns['Date'] = history.index.strftime(date_utils.STANDARD_DATE_FORMAT).tolist()
+        return columns
+
+    @staticmethod
+    @disk_cache.memoize(
+        expire=CACHE_EXPIRY_S,
+        bypass=lambda api_endpoint, from_date, to_date, **kwargs: to_date >= date_utils.get_date()
+    )
+    def _request_finnhub_batch(api_endpoint: Callable, from_date: str, to_date: str, **kwargs) -> Any:
+        """Requests a single batch from a given finnhub endpoint, within the rate limit."""
+        finnhub_rate_limiter.wait()
+        return api_endpoint(_from=from_date, to=to_date, **kwargs)
     
     def _get_company_news(self) -> List[Dict[str, Any]]:
         """Fetches company news."""
         try:
             return self.finnhub_client.company_news(
                 self.ticker,
-                _from=date_utils.get_date(self.start_date),
-                to=date_utils.get_date(self.end_date)
+                _from=self.start_date_str,
+                to=self.end_date_str
             )
         except Exception as e:
             print(f"Error fetching Finnhub company news: {e}")
@@ -147,8 +305,8 @@ class DataFetcher:
         try: 
             return self.finnhub_client.filings(
                 symbol=self.ticker, 
-                _from=date_utils.get_date(self.start_date),
-                to=date_utils.get_date(self.end_date)
+                _from=self.start_date_str,
+                to=self.end_date_str
             )
         except Exception as e:
             print(f"Error fetching Finnhub SEC filings: {e}")
@@ -159,8 +317,8 @@ class DataFetcher:
         try:
             return self.finnhub_client.stock_insider_transactions(
                 symbol=self.ticker, 
-                _from=date_utils.get_date(self.start_date),
-                to=date_utils.get_date(self.end_date)
+                _from=self.start_date_str,
+                to=self.end_date_str
             )
         except Exception as e:
             print(f"Error fetching Finnhub insider transactions: {e}")
@@ -1,28 +1,99 @@
 import dash
-from dash import dcc, html, Input, Output, State, ctx, no_update
+from dash import dcc, html, Input, Output, State, ClientsideFunction, no_update
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import os
+import threading
 import plotly.graph_objects as go
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from flask_caching import Cache
+
 from stockchart.utils import date_utils
 from stockchart.components.chart import ChartBuilder
 from stockchart.components.data_manager import DataManager
 
+CACHE_TIMEOUT_S = 24 * 60 * 60 # Keys include the date, so entries roll over daily anyway
+EVENT_CACHE_TIMEOUT_S = 10 * 60 # Below the events' own 6 hour staleness check
+REDIS_SOCKET_OPTIONS = {'socket_connect_timeout': 1, 'socket_timeout': 1} # Fail fast rather than on the OS TCP timeout
+
+def get_cache_config() -> dict:
+    """
+    Returns the callback cache config, shared through Redis if REDIS_URL is set and reachable at startup.
+    Note: Redis errors at runtime are logged and the value recomputed, except in debug mode where Flask-Caching re-raises them.
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            import redis
+        except ImportError:
+            redis = None
+            print("REDIS_URL is set, but redis is not installed. Falling back to the filesystem cache.")
+
+        if redis is not None:
+            try:
+                redis.Redis.from_url(redis_url, **REDIS_SOCKET_OPTIONS).ping()
+                return {
+                    'CACHE_TYPE': 'RedisCache',
+                    'CACHE_REDIS_URL': redis_url,
+                    'CACHE_OPTIONS': REDIS_SOCKET_OPTIONS,
+                    'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT_S,
+                }
+            except redis.RedisError as e:
+                print(f"Redis unavailable at {redis_url}: {e}. Falling back to the filesystem cache.")
+    return {
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': os.path.join('cache', 'flask'),
+        'CACHE_DEFAULT_TIMEOUT': CACHE_TIMEOUT_S,
+    }
+
+# Static styles, shared by every app instance and render
+
+LOGO_STYLE = {
+    'width': '24px',
+    'height': '24px',
+    'border-radius': '50%',
+    'background-size': 'cover',
+    'background-position': 'center',
+    'background-repeat': 'no-repeat',
+    'vertical-align': 'middle',
+}
+LOGO_PLACEHOLDER_STYLE = {**LOGO_STYLE, 'background-color': '#555555'}
+CHART_TITLE_STYLE = {'vertical-align': 'middle'}
+GRAPH_STYLE = {'height': '90vh'}
+CHART_CARD_STYLE = {'background-color': '#111111', 'height': '100%'}
+COLUMN_STYLE = {'height': '100%', 'display': 'flex', 'flex-direction': 'column'}
+INFO_CONTENT_STYLE = {'overflowY': 'auto'}
+INFO_CARD_STYLE = {'min-height': '0', 'height': '95%'}
+LOADING_CARD_STYLE = {'height': '5%', 'cursor': 'pointer', 'background-color': '#303030', 'border': 'none', 'color': 'white'}
+HIDDEN_STYLE = {'display': 'none'}
+
+LOADING_EVENTS_CARD = dbc.Card(
+    dbc.CardBody(
+        html.P("Loading events...", className="card-text text-center m-0")
+    ),
+    className="rounded-4 bg-secondary"
+)
+
 class StockChartApp:
     """The main application class."""
     def __init__(self, ticker="NVDA"):
         self.ticker = ticker
         self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.DARKLY])
         self.data_manager = DataManager(ticker=ticker)
+        # Shared across tabs/ users; keyed on (ticker, date) so entries roll over daily
+        self.cache = Cache(self.app.server, config=get_cache_config())
         self._setup_layout()
         self._setup_callbacks()
 
     def _setup_layout(self):
         """Set up the layout of the"""
         self.app.layout = dbc.Container([
+            dcc.Location(id='url', refresh=False),
             dcc.Store(id='event-data-store'),
+            dcc.Store(id='event-stream-version'), # Version of the streamed events last sent to this session
+            dcc.Interval(id='event-stream-interval', interval=500, disabled=True),
             # Chart
             dbc.Row([
                 dbc.Col([
@@ -31,36 +102,24 @@ class StockChartApp:
                             [   
                                 dbc.Row([
                                     dbc.Col(
-                                        html.Div(id='logo-image', style={
-                                            'width': '24px',
-                                            'height': '24px',
-                                            'border-radius': '50%',
-                                            'background-color': '#555555', # Placeholder
-                                            'background-size': 'cover',
-                                            'background-position': 'center',
-                                            'background-repeat': 'no-repeat',
-                                            'vertical-align': 'middle',
-                                        }),
+                                        html.Div(id='logo-image', style=LOGO_PLACEHOLDER_STYLE),
                                         width="auto",
                                     ),
                                     dbc.Col(
-                                        html.P(f"{self.ticker} - 3 Month", className="mb-0 ms-2", style={'vertical-align': 'middle'}),
+                                        html.P(f"{self.ticker} - 3 Month", className="mb-0 ms-2", style=CHART_TITLE_STYLE),
                                         width="auto"
                                     )
                                 ], className="d-flex align-items-center mb-2"),
                                 dcc.Loading(
                                     type="circle",
-                                    children=dcc.Graph(id='stock-chart', style={'height': '90vh'})
+                                    children=dcc.Graph(id='stock-chart', style=GRAPH_STYLE)
                                 )
                             ]
                         ), 
                         className="rounded-4 d-flex flex-column", 
-                        style={
-                            'background-color': '#111111', 
-                            'height': '100%',
-                            }
+                        style=CHART_CARD_STYLE
                     ),
-                ], width=9,  style={'height': '100%', 'display': 'flex', 'flex-direction': 'column'}),
+                ], width=9,  style=COLUMN_STYLE),
                 # Information panel and App card
                 dbc.Col([
                     dbc.Card(
@@ -70,7 +129,7 @@ class StockChartApp:
                                     [
                                         dbc.Col(html.H3(id='info-date', children=html.B("Today"))),
                                         dbc.Col(
-                                            dbc.Button("X", id='close-info-button', size="sm", className="ms-auto", style={'display': 'none'}),
+                                            dbc.Button("X", id='close-info-button', size="sm", className="ms-auto", style=HIDDEN_STYLE),
                                             width="auto"
                                         )
                                     ],
@@ -79,21 +138,14 @@ class StockChartApp:
                                 ),
                                 html.Div(
                                     id='info-content',
-                                    style={'overflowY': 'auto'},
-                                    children=[
-                                        dbc.Card(
-                                            dbc.CardBody(
-                                                html.P("Loading events...", className="card-text text-center m-0")
-                                            ),
-                                            className="rounded-4 bg-secondary"
-                                        )
-                                    ]
+                                    style=INFO_CONTENT_STYLE,
+                                    children=[LOADING_EVENTS_CARD]
                                 )
                             ],
                             className="d-flex flex-column h-100"
                         ),
                         className="rounded-4 flex-grow-1",
-                        style={'min-height': '0', 'height': '95%'}
+                        style=INFO_CARD_STYLE
                     ),
                     dbc.Button(
                         [
@@ -106,168 +158,121 @@ class StockChartApp:
                         id="loading-card", 
                         n_clicks=0,
                         className="mt-4 rounded-4", 
-                        style={'height': '5%', 'cursor': 'pointer', 'background-color': '#303030', 'border': 'none', 'color': 'white'}
+                        style=LOADING_CARD_STYLE
                     ),
 
-                ], width=3,  style={'height': '100%', 'display': 'flex', 'flex-direction': 'column'}
+                ], width=3,  style=COLUMN_STYLE
                 ),
             ], style={'height': '100%'})
         ], fluid=True, className="p-4 vh-100")
 
-    def _create_event_cards(self, events):
-        """Creates a list of styled Card components for events."""
-        if not events:
-            return [
-                dbc.Card(
-                    dbc.CardBody(
-                        html.P("All caught up!", className="card-text text-center m-0")
-                    ),
-                    className="mb-3 rounded-4 bg-secondary"
-                )
-            ]
-
-        event_cards = []
-        for event in events:
-            event_type_color = {
-                "Macro News": "primary",
-                "News": "success",
-                "SEC Filing": "warning",
-                "Insider Transaction": "info"
-            }.get(event.get('type'), "#222529")
-
-            content_lines = event.get('content', '').split('\n')
-            content_with_breaks = []
-            for i, line in enumerate(content_lines):
-                if i > 0:
-                    content_with_breaks.append(html.Br())
-                content_with_breaks.append(line)
+    def _event_store_data(self, events_by_date):
+        """Wraps the indexed events with the server's date, for the clientside rendering."""
+        return {'today': date_utils.get_date(), 'by_date': events_by_date}
 
-            card = dbc.Card(
-                dbc.CardBody([
-                    # Header
-                    dbc.Row(
-                        [
-                            dbc.Col(
-                                dbc.Badge(event.get('type', 'Event'), color=event_type_color, className="me-1"),
-                                width="auto"
-                            ),
-                            dbc.Col(
-                                html.Small(event.get('time', ''), className="text-muted"),
-                                className="text-end"
-                            )
-                        ],
-                        align="center",
-                        className="mb-2"
-                    ),
-
-                    # Title
-                    html.H6(
-                        event.get('title', 'No Title'),
-                        className="mt-3 card-title fw-bold",
-                        style={
-                            'whiteSpace': 'nowrap',
-                            'overflow': 'hidden',
-                            'textOverflow': 'ellipsis'
-                        }
-                    ),
+    def _setup_callbacks(self):
+        """Set up necessary callbacks for interactivity."""
+        # None (failed fetch) is not memoized, so it is retried on the next load
+        @self.cache.memoize()
+        def cached_logo_url(ticker, date):
+            return self.data_manager.load_logo() or None
 
-                    # Content
-                    html.P(
-                        content_with_breaks,
-                        className="card-text small text-muted mb-2"
-                    ),
+        @self.cache.memoize()
+        def cached_price_figure(ticker, date):
+            price = self.data_manager.load_price_data()
+            if price.empty:
+                return None
+            # Cached as a plain dict, unpickling a go.Figure re-validates every trace
+            return ChartBuilder(price).create_figure().to_dict()
 
-                    # Footer
-                    html.A(
-                        event.get('source', 'Read more'),
-                        href=event.get('url', '#'),
-                        target="_blank",
-                        rel="noopener noreferrer",
-                        className="card-link small"
-                    )
-                ]),
-                className="mb-3 rounded-4 bg-secondary"
-            )
-            event_cards.append(card)
-        return event_cards
+        @self.cache.memoize(timeout=EVENT_CACHE_TIMEOUT_S)
+        def cached_events_by_date(ticker, date):
+            events = self.data_manager.load_cached_event_data()
+            # None (no fresh cache entry) is not memoized
+            return None if events is None else self.data_manager.index_events_by_date(events)
 
-    def _setup_callbacks(self):
-        """Set up necessary callbacks for interactivity."""
         @self.app.callback(
             Output('logo-image', 'style'),
-            Input('loading-card', 'n_clicks'),
+            Input('url', 'pathname'),
         )
-        def load_logo_url(n_clicks):
-            """Loads the ticker logo URL."""
-            logo_url = self.data_manager.load_logo()
-            if logo_url:
-                return {
-                    'width': '24px',
-                    'height': '24px',
-                    'border-radius': '50%',
-                    'background-image': f'url({logo_url})',
-                    'background-size': 'cover',
-                    'background-position': 'center',
-                    'background-repeat': 'no-repeat',
-                    'vertical-align': 'middle',
-                }
-            return no_update
+        def load_chart_logo(pathname):
+            """Loads the ticker logo URL, the placeholder stays if there is none."""
+            logo_url = cached_logo_url(self.ticker, date_utils.get_date())
+            if not logo_url:
+                raise PreventUpdate
+            return {**LOGO_STYLE, 'background-image': f'url({logo_url})'}
         
         @self.app.callback(
             Output('stock-chart', 'figure'),
-            Input('loading-card', 'n_clicks')
+            Input('url', 'pathname')
         )
-        def load_price_chart(n_clicks):
+        def load_price_chart(pathname):
             """This callback is triggered on page load for loading the price chart"""
-            price = self.data_manager.load_price_data()
-            chart_builder = ChartBuilder(price)
-            fig = chart_builder.create_figure()
-            return fig
+            figure = cached_price_figure(self.ticker, date_utils.get_date())
+            if figure is None:
+                raise PreventUpdate
+            return figure
 
         @self.app.callback(
             Output('event-data-store', 'data'),
             Output('loading-title-text', 'children'),
+            Output('event-stream-interval', 'disabled'),
             Input('loading-card', 'n_clicks'),
         )
         def load_event_data(n_clicks):
             """This callback is triggered on page load for loading the events"""
-            force_refresh = n_clicks is not None
-            return self.data_manager.load_event_data(force_refresh=force_refresh), "StockChart"
+            if not n_clicks: # Page load, use the cached events if available
+                events_by_date = cached_events_by_date(self.ticker, date_utils.get_date())
+                if events_by_date is not None:
+                    return self._event_store_data(events_by_date), "StockChart", True
+
+            # Otherwise fetch in the background, polling for the events as each source completes
+            self.data_manager.start_event_stream(force_refresh=bool(n_clicks))
+            return no_update, "StockChart", False
 
         @self.app.callback(
-            [
-                Output('info-date', 'children'),
-                Output('info-content', 'children'), 
-                Output('close-info-button', 'style')
-            ],
-            [
-                Input('event-data-store', 'data'),
-                Input('stock-chart', 'clickData'),
-                Input('close-info-button', 'n_clicks')
-            ],
-            State('event-data-store', 'data')
+            Output('event-data-store', 'data', allow_duplicate=True),
+            Output('event-stream-interval', 'disabled', allow_duplicate=True),
+            Output('event-stream-version', 'data'),
+            Input('event-stream-interval', 'n_intervals'),
+            State('event-stream-version', 'data'),
+            prevent_initial_call=True
+        )
+        def poll_event_data(n_intervals, sent_version):
+            """This callback is triggered periodically while the events are loading"""
+            events_by_date, version, done = self.data_manager.event_stream_progress()
+            if done:
+                self.cache.delete_memoized(cached_events_by_date, self.ticker, date_utils.get_date())
+            elif not events_by_date or version == sent_version:
+                raise PreventUpdate
+            # The events are only resent when a source has completed since the last poll
+            store_data = no_update if version == sent_version else self._event_store_data(events_by_date)
+            return store_data, done, version
+
+        # Rendered in the browser (assets/info.js), as it only formats the stored events
+        self.app.clientside_callback(
+            ClientsideFunction(namespace='info', function_name='render'),
+            Output('info-date', 'children'),
+            Output('info-content', 'children'),
+            Output('close-info-button', 'style'),
+            Input('event-data-store', 'data'),
+            Input('stock-chart', 'clickData'),
+            Input('close-info-button', 'n_clicks'),
+            State('close-info-button', 'style')
         )
-        def update_info_panel(event_data_input, clickData, close_clicks, all_events):
-            """This callback is triggered on refresh or pressing the close button"""
-            triggered_id = ctx.triggered_id
 
-            if event_data_input is None:
-                return html.B("Today"), no_update, {'display': 'none'}
-            
-            if triggered_id == 'stock-chart' and clickData:
-                clicked_date = clickData['points'][0]['x']
-                clicked_date = date_utils.get_date(clicked_date)
-                
-                _, display_date, _ = date_utils.string_to_display(date_string=clicked_date)
-                events_on_date = self.data_manager.day_events(events=all_events, date=clicked_date)
-                event_cards = self._create_event_cards(events_on_date)
-                
-                return html.B(f"{display_date}"), event_cards, {'display': 'block'}
-            
-            todays_events = self.data_manager.day_events(events=event_data_input)
-            event_cards = self._create_event_cards(todays_events)
-            return html.B("Today"), event_cards, {'display': 'none'}
+        def warmup():
+            """Populates the data caches, then the figure built from them."""
+            self.data_manager.warmup()
+            cached_price_figure(self.ticker, date_utils.get_date())
+
+        # Warm up in the background, so that the first page load only reads from the caches
+        self._warmup = threading.Thread(target=warmup, daemon=True)
+        self._warmup.start()
 
     def run(self, debug=True):
         """Entry point to run the app"""
-        self.app.run(debug=debug)
\ No newline at end of file
+        try:
+            self.app.run(debug=debug)
+        finally:
+            self.data_manager.close()
\ No newline at end of file
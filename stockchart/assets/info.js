@@ -0,0 +1,115 @@
+// Renders the information panel in the browser, from the events in 'event-data-store'.
+
+const EVENT_TYPE_COLORS = {
+    'Macro News': 'primary',
+    'News': 'success',
+    'SEC Filing': 'warning',
+    'Insider Transaction': 'info'
+};
+const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+const WEEKDAYS = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+const EVENT_TITLE_STYLE = {'whiteSpace': 'nowrap', 'overflow': 'hidden', 'textOverflow': 'ellipsis'};
+const EVENT_CONTENT_STYLE = {'whiteSpace': 'pre-line'};
+
+function component(namespace, type, props) {
+    return {namespace: namespace, type: type, props: props};
+}
+const html = (type, props) => component('dash_html_components', type, props);
+const dbc = (type, props) => component('dash_bootstrap_components', type, props);
+
+// 'YYYY-MM-DD' -> 'Mon DD, YYYY - Day', matching date_utils.DISPLAY_DATE_FORMAT
+function displayDate(stdDate) {
+    const [year, month, day] = stdDate.split('-').map(Number);
+    const date = new Date(Date.UTC(year, month - 1, day));
+    const dd = String(day).padStart(2, '0');
+    return `${MONTHS[month - 1]} ${dd}, ${year} - ${WEEKDAYS[date.getUTCDay()]}`;
+}
+
+function eventCard(event) {
+    const type = event.type || 'Event';
+    return dbc('Card', {
+        className: 'mb-3 rounded-4 bg-secondary',
+        children: dbc('CardBody', {children: [
+            // Header
+            dbc('Row', {
+                align: 'center',
+                className: 'mb-2',
+                children: [
+                    dbc('Col', {width: 'auto', children: dbc('Badge', {
+                        children: type,
+                        color: EVENT_TYPE_COLORS[event.type] || '#222529',
+                        className: 'me-1'
+                    })}),
+                    dbc('Col', {className: 'text-end', children: html('Small', {
+                        children: event.time || '',
+                        className: 'text-muted'
+                    })})
+                ]
+            }),
+            // Title
+            html('H6', {
+                children: event.title || 'No Title',
+                className: 'mt-3 card-title fw-bold',
+                style: EVENT_TITLE_STYLE
+            }),
+            // Content (rendered as plain text, pre-line keeps the line breaks)
+            html('P', {
+                children: event.content || '',
+                className: 'card-text small text-muted mb-2',
+                style: EVENT_CONTENT_STYLE
+            }),
+            // Footer
+            html('A', {
+                children: event.source || 'Read more',
+                href: event.url || '#',
+                target: '_blank',
+                rel: 'noopener noreferrer',
+                className: 'card-link small'
+            })
+        ]})
+    });
+}
+
+function eventCards(events) {
+    if (!events || events.length === 0) {
+        return [dbc('Card', {
+            className: 'mb-3 rounded-4 bg-secondary',
+            children: dbc('CardBody', {children: html('P', {
+                children: 'All caught up!',
+                className: 'card-text text-center m-0'
+            })})
+        })];
+    }
+    return events.map(eventCard);
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    info: {
+        render: function(eventData, clickData, closeClicks, closeStyle) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!eventData) {
+                return [noUpdate, noUpdate, noUpdate];
+            }
+
+            // A clicked date stays selected (close button shown) through event updates, until it is closed
+            const triggered = window.dash_clientside.callback_context.triggered_id;
+            const dateSelected = triggered === 'stock-chart'
+                || (triggered === 'event-data-store' && (closeStyle || {}).display === 'block');
+            if (dateSelected && clickData) {
+                const clickedDate = String(clickData.points[0].x).slice(0, 10);
+                return [
+                    html('B', {children: displayDate(clickedDate)}),
+                    eventCards(eventData.by_date[clickedDate]),
+                    {'display': 'block'}
+                ];
+            }
+
+            // Page load, or closing a date's events
+            return [
+                html('B', {children: 'Today'}),
+                eventCards(eventData.by_date[eventData.today]),
+                {'display': 'none'}
+            ];
+        }
+    }
+});
@@ -1,90 +1,116 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Static layout, validated once and copied into every figure
+LAYOUT = go.Layout(
+    plot_bgcolor='#111111', paper_bgcolor='#111111',
+    font_color='white', margin=dict(l=20, r=20, t=40, b=20),
+    
+    hovermode='x unified',
+    
+    xaxis=dict(
+        rangeslider_visible=False,
+        gridcolor='#444444',
+        showgrid=True,
+        showspikes=True,
+        spikemode='across',
+        spikecolor='#999999',
+        spikethickness=1,
+        linecolor='#444444'
+    ),
+    yaxis=dict(
+        side='right',
+        gridcolor='#444444',
+        showgrid=True,
+        showspikes=True,
+        spikemode='across',
+        spikecolor='#999999',
+        spikethickness=1,
+        linecolor='#444444'
+    ),
+    
+    yaxis2=dict(
+        title='Volume',
+        side='left',
+        overlaying='y',
+        showgrid=False,
+        showspikes=True,
+        spikemode='across',
+        spikecolor='#999999',
+        spikethickness=1,
+        linecolor='#444444',
+        visible=False
+    )
+)
+
+MAX_CANDLES = 2000 # Longer ranges are aggregated, there are more bars than pixels to draw them in
+
+# Date, then the open, high, low and close prices
+HOVERTEXT_TEMPLATE = (
+    "<b>%s</b><br><br>"
+    "<b>Price:</b> <br>"
+    "<b>Open:</b> %.2f USD <br>"
+    "<b>High:</b> %.2f USD <br>"
+    "<b>Low:</b> %.2f USD<br>"
+    "<b>Close:</b> %.2f USD<br>"
+)
+
 class ChartBuilder:
     """Builds the Plotly candlestick and volume chart."""
     def __init__(self, price_data: pd.DataFrame):
+        if len(price_data) > MAX_CANDLES:
+            price_data = self._downsample_ohlc(price_data, MAX_CANDLES)
         self.price_data = price_data
 
+    @staticmethod
+    def _downsample_ohlc(price_data: pd.DataFrame, target_buckets: int) -> pd.DataFrame:
+        """Aggregates consecutive bars into at most target_buckets bars, each dated by its first bar."""
+        bucket_size = -(-len(price_data) // target_buckets) # Ceiling division
+        buckets = np.arange(len(price_data)) // bucket_size
+        downsampled = price_data.groupby(buckets).agg(
+            {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+        )
+        downsampled.index = price_data.index[::bucket_size]
+        return downsampled
+
     def create_figure(self) -> go.Figure:
         """Creates and returns a configured Plotly Figure object with price and volume subplots."""
-        fig = go.Figure()
+        # Plain arrays, both for zipping (iterrows boxes every row into a Series) and for Plotly's serializer
+        index = pd.DatetimeIndex(self.price_data.index)
+        open_prices = self.price_data['Open'].to_numpy()
+        high_prices = self.price_data['High'].to_numpy()
+        low_prices = self.price_data['Low'].to_numpy()
+        close_prices = self.price_data['Close'].to_numpy()
 
+        dates = index.strftime('%a, %b %d')
         hovertext_price = [
-            f"<b>{row.name.strftime('%a, %b %d')}</b><br><br>"
-            f"<b>Price:</b> <br>"
-            f"<b>Open:</b> {row['Open']:.2f} USD <br>"
-            f"<b>High:</b> {row['High']:.2f} USD <br>"
-            f"<b>Low:</b> {row['Low']:.2f} USD<br>"
-            f"<b>Close:</b> {row['Close']:.2f} USD<br>"
-            for index, row in self.price_data.iterrows()
+            HOVERTEXT_TEMPLATE % row
+            for row in zip(dates, open_prices, high_prices, low_prices, close_prices)
         ]
         
-        # Candlestick trace for price data
-        fig.add_trace(
-            go.Candlestick(
-                x=self.price_data.index,
-                open=self.price_data['Open'],
-                high=self.price_data['High'],
-                low=self.price_data['Low'],
-                close=self.price_data['Close'],
-                name='Price', hovertext=hovertext_price,
-                hoverinfo='text'
-            )
+        return go.Figure(
+            data=[
+                # Candlestick trace for price data
+                go.Candlestick(
+                    x=index,
+                    open=open_prices,
+                    high=high_prices,
+                    low=low_prices,
+                    close=close_prices,
+                    name='Price', hovertext=hovertext_price,
+                    hoverinfo='text'
+                ),
+                # Bar trace for volume data
+                go.Bar(
+                    x=index,
+                    y=self.price_data['Volume'].to_numpy(),
+                    name='Volume',
+                    yaxis='y2',
+                    marker_color='#5A5A5A',
+                    opacity=0.2, hovertemplate="<b>Volume:</b> %{y}<extra></extra>"
+                )
+            ],
+            layout=LAYOUT
         )
-        
-        # Bar trace for volume data
-        fig.add_trace(
-            go.Bar(
-                x=self.price_data.index,
-                y=self.price_data['Volume'],
-                name='Volume',
-                yaxis='y2',
-                marker_color='#5A5A5A',
-                opacity=0.2, hovertemplate="<b>Volume:</b> %{y}<extra></extra>"
-            )
-        )
-
-        fig.update_layout(
-            plot_bgcolor='#111111', paper_bgcolor='#111111',
-            font_color='white', margin=dict(l=20, r=20, t=40, b=20),
-            
-            hovermode='x unified',
-            
-            xaxis=dict(
-                rangeslider_visible=False,
-                gridcolor='#444444',
-                showgrid=True,
-                showspikes=True,
-                spikemode='across',
-                spikecolor='#999999',
-                spikethickness=1,
-                linecolor='#444444'
-            ),
-            yaxis=dict(
-                side='right',
-                gridcolor='#444444',
-                showgrid=True,
-                showspikes=True,
-                spikemode='across',
-                spikecolor='#999999',
-                spikethickness=1,
-                linecolor='#444444'
-            ),
-            
-            yaxis2=dict(
-                title='Volume',
-                side='left',
-                overlaying='y',
-                showgrid=False,
-                showspikes=True,
-                spikemode='across',
-                spikecolor='#999999',
-                spikethickness=1,
-                linecolor='#444444',
-                visible=False
-            )
-        )
-        
-        return fig
@@ -1,12 +1,32 @@
 import pandas as pd
-from enum import Enum
-from typing import Dict, Any, List, Generator
-from stockchart.api.data_fetcher import DataFetcher
+from typing import Dict, Any, Iterable, List, Generator, NamedTuple, Optional, Tuple
+from stockchart.api.data_fetcher import DataFetcher, PRICE_COLUMNS, PRICE_DTYPES
 from stockchart.utils import date_utils
-from itertools import groupby
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
+from operator import itemgetter
 import os
-import json
+import orjson
 import heapq
+import threading
+import time
+
+FETCH_TIMEOUT_S = 30
+PRICE_ROUNDING = {'Open': 2, 'High': 2, 'Low': 2, 'Close': 2}
+
+# Event sources, in the order their events are merged
+EVENT_SOURCES = ('macro_news', 'company_news', 'filings', 'insider_transactions')
+
+# Raw records missing (or with empty) any of these fields are skipped
+MACRO_NEWS_REQUIRED_KEYS = ('title', 'summary', 'time_published')
+COMPANY_NEWS_REQUIRED_KEYS = ('headline', 'summary', 'datetime')
+SEC_FILING_REQUIRED_KEYS = ('form', 'filedDate', 'reportUrl')
+INSIDER_TRANSACTION_REQUIRED_KEYS = ('transactionDate', 'share', 'change', 'name', 'transactionPrice', 'transactionCode')
+
+# Read each record's fields in one call, once it has passed the required keys check
+get_macro_news_fields = itemgetter('time_published', 'title', 'summary', 'source', 'url')
+get_company_news_fields = itemgetter('datetime', 'headline', 'summary', 'source', 'url')
+get_insider_transaction_fields = itemgetter(*INSIDER_TRANSACTION_REQUIRED_KEYS)
 
 class DataManager:
     """Handles fetching and processing of all financial data."""
@@ -14,110 +34,203 @@ class DataManager:
         self.ticker = ticker
         self.data_fetcher = DataFetcher(ticker=ticker)
         self._cache_dir = "cache"
+        self._event_lock = threading.Lock()
+
+        # Progressive event loading state
+        self._stream_lock = threading.Lock()
+        self._stream_thread = None
+        self._stream_events_by_date = {}
+        self._stream_version = 0 # Bumped whenever the streamed events change, never reset
+        self._stream_done = False
         os.makedirs(self._cache_dir, exist_ok=True)
 
+    def warmup(self) -> None:
+        """Loads the price and event data ahead of time, populating the caches."""
+        try:
+            self.load_all(force_refresh=False)
+        except Exception as e:
+            print(f"Error warming up data for {self.ticker}: {e}")
+
+    def load_all(self, force_refresh: bool = False) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """Loads the price and event data concurrently, as they come from independent sources."""
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="load-all") as executor:
+            price_future = executor.submit(self.load_price_data)
+            events_future = executor.submit(self.load_event_data, force_refresh=force_refresh)
+            return price_future.result(), events_future.result()
+
     def load_logo(self) -> str:
         """Fetches ticker icon URL."""
         logo_future = self.data_fetcher.fetch_logo_async()
-        return logo_future.result()
+        try:
+            return logo_future.result(timeout=FETCH_TIMEOUT_S)
+        except FutureTimeoutError:
+            print(f"Timed out fetching the logo for {self.ticker}")
+            return ''
 
     def load_price_data(self) -> pd.DataFrame:
         """Fetches and cleans raw price data in parallel."""
         price_future = self.data_fetcher.fetch_price_async()
-        price = price_future.result()
+        try:
+            price = price_future.result(timeout=FETCH_TIMEOUT_S)
+        except FutureTimeoutError:
+            print(f"Timed out fetching the price history for {self.ticker}")
+            return pd.DataFrame(columns=PRICE_COLUMNS).astype(PRICE_DTYPES)
         if not price.empty:
             price = self._clean_price_data(price)
         return price
     
     def _clean_price_data(self, price_df: pd.DataFrame) -> pd.DataFrame:
         """Performs essential data cleaning on the raw price DataFrame."""
-        # Drop any rows with missing data
-        price_df.dropna(inplace=True)
-        
-        # Round the price columns to 2 decimal places
-        price_cols = ['Open', 'High', 'Low', 'Close']
-        price_df[price_cols] = price_df[price_cols].round(2)
-        
-        # Drop columns that are not needed for the chart
-        if 'Dividends' in price_df.columns and 'Stock Splits' in price_df.columns:
-            price_df = price_df.drop(columns=['Dividends', 'Stock Splits'])
-        
-        return price_df
+        # Drop any rows with missing data, then round the price columns to 2 decimal places.
+        # The fetcher already selects only the chart's columns (PRICE_COLUMNS).
+        return price_df.dropna().round(PRICE_ROUNDING)
     
     def load_event_data(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """Fetches raw event data and processes them."""
-        cache_path = os.path.join(self._cache_dir, f"{self.ticker}_events.json")
-
-        # Check if a valid, non-stale cache entry exists
-        if not force_refresh and os.path.exists(cache_path):
-            with open(cache_path, 'r') as f:
-                try:
-                    cached_data = json.load(f)
-                    # Check if the cache is older than the specified duration
-                    if not date_utils.is_exceed_duration(
-                        cache_date_time=cached_data.get('timestamp'),
-                        comparable_date_time=date_utils.get_ISO_date_time(date_obj=date_utils.now()),
-                        duration_h=6
-                        ):
-                        return cached_data.get('data')
-                        
-                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-                    print(f"Error reading cache file for {self.ticker}, or it's in an old format: {e}. Fetching new data.")
-        self.clear_cache()
-
-        raw_events = self._fetch_event_data()
-        processed_events = list(self._postprocess_events(events=raw_events))
+        processed_events = []
+        for processed_events in self.load_event_data_stream(force_refresh=force_refresh):
+            pass
+        return processed_events
 
+    def load_event_data_stream(self, force_refresh: bool = False) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        Fetches raw event data and processes them, yielding all events processed so far each time an event source completes.
+        The last list yielded contains all events.
+        """
+        # Serialized, so that concurrent loads (e.g. warmup and a callback) share one fetch
+        with self._event_lock:
+            if not force_refresh:
+                cached_events = self.load_cached_event_data()
+                if cached_events is not None:
+                    yield cached_events
+                    return
+            self.clear_cache()
+
+            # Each source is processed once, as it arrives, while the others are still being fetched
+            processed_by_source = {}
+            processed_events = []
+            try:
+                for source, raw_events in self._fetch_event_data():
+                    processed_by_source[source] = list(self._process_source(source, raw_events))
+                    processed_events = list(self._postprocess_events(
+                        event for name in EVENT_SOURCES for event in processed_by_source.get(name, [])
+                    ))
+                    yield processed_events
+            except FutureTimeoutError as e:
+                # The events yielded so far are incomplete, so they are not cached
+                print(e)
+                return
+
+            self._save_event_data(processed_events)
+
+    def load_cached_event_data(self) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached events, or None if there is no valid, non-stale cache entry."""
+        cache_path = self._event_cache_path()
+        if not os.path.exists(cache_path):
+            return None
+
+        with open(cache_path, 'rb') as f:
+            try:
+                cached_data = orjson.loads(f.read())
+                # Check if the cache is older than the specified duration
+                if not date_utils.is_exceed_duration(
+                    cache_date_time=cached_data.get('timestamp'),
+                    comparable_date_time=date_utils.get_ISO_date_time(date_obj=date_utils.now()),
+                    duration_h=6
+                    ):
+                    return cached_data.get('data')
+                    
+            except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                print(f"Error reading cache file for {self.ticker}, or it's in an old format: {e}. Fetching new data.")
+        return None
+
+    def _save_event_data(self, processed_events: List[Dict[str, Any]]) -> None:
+        """Saves the processed events to the cache."""
         data_to_save = {
             'data': processed_events,
             'timestamp': date_utils.get_ISO_date_time(date_obj=date_utils.now())
         }
-        with open(cache_path, 'w') as f:
-            json.dump(data_to_save, f)
-        return processed_events
+        with open(self._event_cache_path(), 'wb') as f:
+            f.write(orjson.dumps(data_to_save))
+
+    def _event_cache_path(self) -> str:
+        """Returns the path of the events cache file."""
+        return os.path.join(self._cache_dir, f"{self.ticker}_events.json")
+
+    # Progressive loading, polled by the app
+
+    def start_event_stream(self, force_refresh: bool = False) -> None:
+        """Starts loading the events in the background, see event_stream_progress() for the results."""
+        with self._stream_lock:
+            if self._stream_thread is not None and self._stream_thread.is_alive():
+                return
+            self._stream_events_by_date, self._stream_done = {}, False
+            self._stream_thread = threading.Thread(target=self._consume_event_stream, args=(force_refresh,), daemon=True)
+            self._stream_thread.start()
+
+    def event_stream_progress(self) -> Tuple[Dict[str, List[Dict[str, Any]]], int, bool]:
+        """Returns the events loaded so far indexed by date, their version (to detect changes), and whether loading is complete."""
+        with self._stream_lock:
+            return self._stream_events_by_date, self._stream_version, self._stream_done
+
+    def _consume_event_stream(self, force_refresh: bool) -> None:
+        """Records the progress of an event stream."""
+        try:
+            for processed_events in self.load_event_data_stream(force_refresh=force_refresh):
+                # Indexed once per completed source, rather than on every poll
+                events_by_date = self.index_events_by_date(processed_events)
+                with self._stream_lock:
+                    self._stream_events_by_date = events_by_date
+                    self._stream_version += 1
+        except Exception as e:
+            print(f"Error loading events for {self.ticker}: {e}")
+        finally:
+            with self._stream_lock:
+                self._stream_done = True
     
     # Process across all endpoints
 
-    def _postprocess_events(self, events: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+    def _postprocess_events(self, events: Iterable[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """
-        Performs post-processing on all events, including deduplication, aggregation and final cleaning.
+        Performs post-processing on the processed events of all sources, including deduplication and final cleaning.
         """
-        # Collect and sort by date for more efficient processing (since processing goes by date)
-        all_events = list(self._process_events(events=events))
-        all_events.sort(key=lambda x: x.get('std_date'))
-        
-        deduplicated_event_gen = self._deduplicate_events(all_events)
+        # No sorting needed, a day's events keep their relative order either way, and they are grouped by date later
+        deduplicated_event_gen = self._deduplicate_events(events)
 
         for event in deduplicated_event_gen:
             title = event.get('title', '')
             content = event.get('content', '')
+            # Truncated copies, the processed events are reused when the next source arrives
             if len(title) > 80:
-                event['title'] = title[:80] + '...'
+                event = {**event, 'title': title[:80] + '...'}
             if len(content) > 250:
-                event['content'] = content[:250] + '...'
+                event = {**event, 'content': content[:250] + '...'}
             yield event
 
-    def _deduplicate_events(self, events: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
+    def _deduplicate_events(self, events: Iterable[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """
-        Drops duplicate events by type, date, and title.
+        Drops duplicate news events by date and title, in a single pass.
+        Keeps the one with the highest importance rank, other events are yielded first.
         """
-        news_events, other_events = [], []
+        news_types = (EventType.MACRO_NEWS.name, EventType.COMPANY_NEWS.name)
+        seen_news, other_events = {}, []
         for event in events:
-            event_type = event.get('type')
-            
-            if event_type in [EventType.MACRO_NEWS.name, EventType.COMPANY_NEWS.name]:
-                news_events.append(event)
-            else:
+            if event.get('type') not in news_types:
                 other_events.append(event)
+                continue
+
+            key = (event.get('std_date'), event.get('title', '').strip().lower())
+            if key not in seen_news or event.get('importance_rank', 0) > seen_news[key].get('importance_rank', 0):
+                seen_news[key] = event
 
         yield from other_events
-        yield from self._deduplicate_news(news_events=news_events)
+        yield from seen_news.values()
 
     # Processing endpoints
 
-    def _process_events(self, events: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+    def _process_source(self, source: str, raw_events: Any) -> Generator[Dict[str, Any], None, None]:
         """
-        Process events to conform to a standard format:
+        Process a source's (one of EVENT_SOURCES) raw events to conform to a standard format:
         {
             'std_date': the standard date format,
             'date': the display date format,
@@ -131,10 +244,14 @@ class DataManager:
         }
         Yields a single event.
         """
-        yield from self._process_macro_news(events.get('macro_news', {}).get('feed', []))
-        yield from self._process_company_news(events.get('company_news', []))
-        yield from self._process_sec_filings(events.get('filings', []))
-        yield from self._process_insider_transactions(events.get('insider_transactions', []))
+        if source == 'macro_news':
+            yield from self._process_macro_news((raw_events or {}).get('feed', []))
+        elif source == 'company_news':
+            yield from self._process_company_news(raw_events or [])
+        elif source == 'filings':
+            yield from self._process_sec_filings(raw_events or [])
+        elif source == 'insider_transactions':
+            yield from self._process_insider_transactions(raw_events or [])
 
     def _process_macro_news(self, news_data: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """Yields an event that conforms to the standard format."""
@@ -153,28 +270,25 @@ class DataManager:
         Processes and aggregates insider transactions, yielding a single aggregated event (for each day).
         Yields an event that conforms to the standard format.
         """
-        transactions = list(self._preprocess_insider_transactions(transactions_data=transactions_data))
-        
-        aggregated_events = []
-
-        keyfunc = lambda e: (e['std_date'], e['name'])
-        transactions.sort(key=keyfunc)
-
-        # Aggregate transactions made by the same name (person) on the same day
-        for (std_date, name), group in groupby(transactions, key=keyfunc):
-            group_list = list(group)
-            total_change = sum(item['change'] for item in group_list)
-
+        # Aggregate transactions made by the same name (person) on the same day, in a single pass
+        totals = {} # (std_date, name) -> [total_change, total_value, first_event]
+        for transaction in self._preprocess_insider_transactions(transactions_data=transactions_data):
+            key = (transaction['std_date'], transaction['name'])
+            if key not in totals:
+                totals[key] = [0, 0.0, transaction] # First event is used as template
+            group_totals = totals[key]
+            group_totals[0] += transaction['change']
+            group_totals[1] += transaction['change'] * transaction['transactionPrice']
+
+        # Sorting only the (few) groups keeps their order stable, by date and name
+        for (std_date, name), (total_change, total_value, first_event) in sorted(totals.items(), key=itemgetter(0)):
             if total_change == 0:
                 continue
 
-            total_value = sum(item['change'] * item['transactionPrice'] for item in group_list)
             avg_price = total_value / total_change
-            
-            first_event = group_list[0] # Used as template
             action = "net acquired" if total_change > 0 else "net disposed of"
             
-            aggregated_event = {
+            yield {
                 'std_date': std_date,
                 'date': first_event['date'],
                 'time': '', 
@@ -185,19 +299,17 @@ class DataManager:
                 'url': first_event['url'],
                 'importance_rank': EventType.INSIDER_TRANSACTION.base_score
             }
-            aggregated_events.append(aggregated_event)
-        
-        yield from aggregated_events
 
     # Preprocessing endpoints
 
     def _preprocess_macro_news(self, news_data: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """Preprocesses and yields macro news events."""
+        event_type, base_score = EventType.MACRO_NEWS
         for m in news_data:
-            if not m.get('title') or not m.get('summary') or not m.get('time_published'):
+            if not all(map(m.get, MACRO_NEWS_REQUIRED_KEYS)):
                 continue
 
-            score = EventType.MACRO_NEWS.base_score
+            score = base_score
             ticker_sentiment_list = m.get('ticker_sentiment', [])
 
             ticker_sentiments = {s['ticker']: s for s in ticker_sentiment_list}
@@ -205,42 +317,46 @@ class DataManager:
             relevance = float(sentiment.get('relevance_score', 0))
             score *= (1 + relevance)
 
-            std_date, date, time = date_utils.string_to_display(m['time_published'])
+            time_published, title, summary, source, url = get_macro_news_fields(m)
+            std_date, date, time = date_utils.string_to_display(time_published)
             yield {
                 'std_date': std_date,
                 'date': date,
                 'time': time,
-                'type': EventType.MACRO_NEWS.name,
-                'title': m['title'],
-                'content': m['summary'],
-                'source': f"🔗 {m['source']}",
-                'url': m['url'],
+                'type': event_type,
+                'title': title,
+                'content': summary,
+                'source': f"🔗 {source}",
+                'url': url,
                 'importance_rank': score
             }
 
     def _preprocess_company_news(self, news_data: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """Preprocesses and yields company news events."""
+        event_type, base_score = EventType.COMPANY_NEWS
         for n in news_data:
-            if not n.get('headline') or not n.get('summary') or not n.get('datetime'):
+            if not all(map(n.get, COMPANY_NEWS_REQUIRED_KEYS)):
                 continue
             
-            std_date, date, time = date_utils.unix_to_display(n['datetime'])
+            timestamp, headline, summary, source, url = get_company_news_fields(n)
+            std_date, date, time = date_utils.unix_to_display(timestamp)
             yield {
                 'std_date': std_date,
                 'date': date,
                 'time': time,
-                'type': EventType.COMPANY_NEWS.name, 
-                'title': n['headline'],
-                'content': n['summary'],
-                'source': f"🔗 {n['source']}",
-                'url': n['url'],
-                'importance_rank': EventType.COMPANY_NEWS.base_score
+                'type': event_type, 
+                'title': headline,
+                'content': summary,
+                'source': f"🔗 {source}",
+                'url': url,
+                'importance_rank': base_score
             }
 
     def _preprocess_sec_filings(self, filings_data: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """Preprocesses and yields SEC filing events."""
+        event_type, base_score = EventType.SEC_FILING
         for f in filings_data:
-            if not f.get('form') or not f.get('filedDate') or not f.get('reportUrl'):
+            if not all(map(f.get, SEC_FILING_REQUIRED_KEYS)):
                 continue
 
             std_date, date, time = date_utils.string_to_display(f['filedDate'])
@@ -248,126 +364,101 @@ class DataManager:
                 'std_date': std_date,
                 'date': date,
                 'time': '',
-                'type': EventType.SEC_FILING.name, 
+                'type': event_type, 
                 'title': f"Form {f['form']}",
                 'content': f"{self.ticker} SEC Filing",
                 'source': "🔗 SEC",
                 'url': f['reportUrl'],
-                'importance_rank': EventType.SEC_FILING.base_score
+                'importance_rank': base_score
             }
 
     def _preprocess_insider_transactions(self, transactions_data: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
         """Preprocesses and yields insider transaction events."""
+        event_type, base_score = EventType.INSIDER_TRANSACTION
         for i in transactions_data:
-            if not i.get('transactionDate') or not i.get('share') or not i.get('change') or not i.get('name') or not i.get('transactionPrice') or not i.get('transactionCode'):
+            if not all(map(i.get, INSIDER_TRANSACTION_REQUIRED_KEYS)):
                 continue
             
-            std_date, date, time = date_utils.string_to_display(i['transactionDate'])
-            action = "increases" if i['change'] > 0 else "decreases"
-            title_string=f"{i['name']} {action} shares in {self.ticker}"
-            content_string=f"Transaction code: {i['transactionCode']}\nTransaction price: {i['transactionPrice']}\nCurrent stake: {i['share']} shares"
+            transaction_date, share, change, name, transaction_price, transaction_code = get_insider_transaction_fields(i)
+            std_date, date, time = date_utils.string_to_display(transaction_date)
+            action = "increases" if change > 0 else "decreases"
             yield {
                 'std_date': std_date,
                 'date': date,
                 'time': time,
-                'name': i.get('name'),
-                'type': EventType.INSIDER_TRANSACTION.name, 
-                'title': f"{title_string}",
-                'content': f"{content_string}",
-                'change': i.get('change'),
-                'transactionPrice': i.get('transactionPrice'),
+                'name': name,
+                'type': event_type, 
+                'title': f"{name} {action} shares in {self.ticker}",
+                'content': f"Transaction code: {transaction_code}\nTransaction price: {transaction_price}\nCurrent stake: {share} shares",
+                'change': change,
+                'transactionPrice': transaction_price,
                 'source': "🔗 List of Transaction Codes (Section 8)",
                 'url': "https://www.sec.gov/about/forms/form4data.pdf",
-                'importance_rank': EventType.INSIDER_TRANSACTION.base_score
+                'importance_rank': base_score
             }
 
     # Fetch
 
-    def _fetch_event_data(self) -> Dict[str, Any]:
-        """Fetches raw event data."""
+    def _fetch_event_data(self) -> Generator[Tuple[str, Any], None, None]:
+        """
+        Fetches raw event data, yielding each source's key and raw events as it completes.
+        Raises FutureTimeoutError naming the pending sources once FETCH_TIMEOUT_S has been spent waiting.
+        """
         event_futures = self.data_fetcher.fetch_events_async()
-        events = {}
-        for key, future in event_futures.items():
-            events[key] = future.result()
-        return events
+        keys = {future: key for key, future in event_futures.items()}
+        pending = set(keys)
+        waited = 0.0
+        while pending:
+            # Only the waits count against the timeout, not the consumer's processing between yields
+            start = time.monotonic()
+            done, pending = wait(pending, timeout=max(FETCH_TIMEOUT_S - waited, 0), return_when=FIRST_COMPLETED)
+            waited += time.monotonic() - start
+            if not done:
+                raise FutureTimeoutError(f"Timed out fetching {', '.join(keys[future] for future in pending)} for {self.ticker}")
+            for future in done:
+                yield keys[future], future.result()
 
     # Others
 
-    def day_events(self, events: List[Dict[str, Any]], date: str = None) -> Dict[str, Any]:
-        """Returns only the current date's events."""
-        selected_date = date_utils.get_date(date)
-        all_day_events = [e for e in events if e['std_date'] == selected_date]
-        return self._top_events(all_day_events)
-    
-    def _top_events(self, events: List[Dict[str, Any]], top: int = 20) -> List[Dict[str, Any]]:
-        """Filters the day's event list to the top 20."""
-        if len(events) < top:
-            return sorted(events, key=lambda x: int(x.get('importance_rank', 0)), reverse=True)
-        
-        top_events_heap = []
-        counter = 0
-    
+    def index_events_by_date(self, events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Groups the events by their standard date, for constant time lookups of a day's events.
+        Each day only keeps its top events, ranked once here.
+        """
+        events_by_date = defaultdict(list)
         for event in events:
-            rank = float(event.get('importance_rank', 0))
-        
-            if len(top_events_heap) < top:
-                heapq.heappush(top_events_heap, (rank, counter, event))
-            else:
-                heapq.heappushpop(top_events_heap, (rank, counter, event))
-
-            counter += 1
+            events_by_date[event['std_date']].append(event)
+        return {std_date: self._top_events(day) for std_date, day in events_by_date.items()}
 
-        return sorted([event for _, _, event in top_events_heap], key=lambda x: int(x.get('importance_rank', 0)), reverse=True)
+    def _top_events(self, events: List[Dict[str, Any]], top: int = 20) -> List[Dict[str, Any]]:
+        """Filters the day's event list to the top 20, highest importance first."""
+        # Ranks are floats (e.g. macro news scales with relevance), so they are compared as is rather than truncated to int
+        return heapq.nlargest(top, events, key=itemgetter('importance_rank'))
     
     def clear_cache(self) -> None:
         """ Clears the stale cache."""
-        cache_path = os.path.join(self._cache_dir, f"{self.ticker}_events.json")
+        cache_path = self._event_cache_path()
         if os.path.exists(cache_path):
             os.remove(cache_path)
             print(f"Cache file for {self.ticker} has been cleared. Please wait for the data to be refreshed.")
         else:
             print(f"No cache file found for {self.ticker} to clear.")
 
-    ####################
-    # Helper functions #
-    ####################
-
-    def _deduplicate_news(self, news_events: List[Dict[str, Any]]) -> Generator[Dict[str, Any], None, None]:
-        """
-        Deduplicates a list of news events based on date and title, keeping the one with the highest importance rank.
-        """
-        seen_news = {}
-        for news in news_events:
-            news_date = news.get('std_date')
-            title = news.get('title', '')
-            normalized_title = title.strip().lower()
+    def close(self) -> None:
+        """Releases the resources held by the data fetcher."""
+        self.data_fetcher.close()
 
-            key = (news_date, normalized_title)
-
-            if key not in seen_news or news.get('importance_rank', 0) > seen_news[key].get('importance_rank', 0):
-                seen_news[key] = news
-        
-        yield from seen_news.values()
+class EventKind(NamedTuple):
+    """An event type's display name and base score."""
+    name: str
+    base_score: float
 
-class EventType(Enum):
+class EventType:
     """
     Defines the types of events with associated string and base scores.
+    Plain class attributes, so reading a name or score in the processing loops needs no enum or property lookup.
     """
-    def __new__(cls, name: str, base_score: float):
-        obj = object.__new__(cls)
-        obj._value_ = name
-        obj._event_name = name
-        obj.base_score = base_score
-        return obj
-
-    @property
-    def name(self):
-        return self._event_name
-
-    MACRO_NEWS = "Macro News", 0.4
-    COMPANY_NEWS = "News", 0.6
-    INSIDER_TRANSACTION = "Insider Transaction", 1.0
-    SEC_FILING = "SEC Filing", 1.0
-
-if __name__ == '__main__':
-    DataManager(ticker="NVDA")
\ No newline at end of file
+    MACRO_NEWS = EventKind("Macro News", 0.4)
+    COMPANY_NEWS = EventKind("News", 0.6)
+    INSIDER_TRANSACTION = EventKind("Insider Transaction", 1.0)
+    SEC_FILING = EventKind("SEC Filing", 1.0)
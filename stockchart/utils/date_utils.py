@@ -1,5 +1,6 @@
-from datetime import datetime, timedelta
-from functools import singledispatch
+import pandas as pd
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any, List, Tuple
 
 STANDARD_DATE_FORMAT = '%Y-%m-%d' # 'YYYY-MM-DD'
@@ -8,6 +9,36 @@ DISPLAY_TIME_FORMAT = '%H:%M'
 
 ISO_DATETIME_FORMAT = '%Y%m%dT%H%M' # 'YYYYMMDDTHHMM'
 ISO_DATETIME_WITH_SECONDS_FORMAT = '%Y%m%dT%H%M%S' # 'YYYYMMDDTHHMMSS'
+STANDARD_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S' # 'YYYY-MM-DD HH:MM:SS'
+
+def _parse_basic_iso(date_string: str) -> datetime:
+    """Parses 'YYYYMMDDTHHMM' or 'YYYYMMDDTHHMMSS' by slicing, as fromisoformat only accepts it from Python 3.11."""
+    if date_string[8] != 'T' or not (date_string[:8] + date_string[9:]).isdigit():
+        raise ValueError(f"Invalid date string format: {date_string}")
+    seconds = int(date_string[13:15]) if len(date_string) == 15 else 0
+    return datetime(
+        int(date_string[0:4]), int(date_string[4:6]), int(date_string[6:8]),
+        int(date_string[9:11]), int(date_string[11:13]), seconds
+    )
+
+# Separator positions of 'YYYY-MM-DD HH:MM:SS', the other characters must be digits
+_STANDARD_SEPARATORS = {4: '-', 7: '-', 10: ' ', 13: ':', 16: ':'}
+
+def _parse_standard(date_string: str) -> datetime:
+    """Parses 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS', rejecting the other ISO forms fromisoformat accepts (e.g. '2024-W01-1')."""
+    separators = {i: sep for i, sep in _STANDARD_SEPARATORS.items() if i < len(date_string)}
+    digits = ''.join(char for i, char in enumerate(date_string) if i not in separators)
+    if any(date_string[i] != sep for i, sep in separators.items()) or not digits.isdigit():
+        raise ValueError(f"Invalid date string format: {date_string}")
+    return datetime.fromisoformat(date_string)
+
+# Supported input date string parsers, by string length
+_PARSERS_BY_LENGTH = {
+    10: _parse_standard, # STANDARD_DATE_FORMAT
+    13: _parse_basic_iso, # ISO_DATETIME_FORMAT
+    15: _parse_basic_iso, # ISO_DATETIME_WITH_SECONDS_FORMAT
+    19: _parse_standard, # STANDARD_DATETIME_FORMAT
+}
 
 # Datetime calculations
 
@@ -21,16 +52,29 @@ def backdate(past_days_ago: int) -> str:
 
 def get_dates_in_range(start_date: datetime, end_date: datetime, batch_size: int = 7) -> List[Tuple[str, str]]:
     """Generates a list of date ranges in reverse chronological order."""
-    ranges = []
-    current_end = end_date
-    
-    while current_end >= start_date:
-        current_start = max(start_date, current_end - timedelta(days=batch_size - 1))
-        ranges.append((get_date(current_start), get_date(current_end)))
-        
-        current_end = current_start - timedelta(days=1)
-        
-    return ranges
+    if end_date < start_date:
+        return []
+
+    batch = timedelta(days=batch_size)
+    periods = (end_date - start_date) // batch + 1
+    ends = pd.date_range(end=end_date, periods=periods, freq=batch)[::-1]
+    starts = ends - timedelta(days=batch_size - 1)
+    starts = starts.where(starts > start_date, pd.Timestamp(start_date))
+
+    return list(zip(starts.strftime(STANDARD_DATE_FORMAT), ends.strftime(STANDARD_DATE_FORMAT)))
+
+def split_date_range(from_date: str, to_date: str) -> List[Tuple[str, str]]:
+    """Splits an (inclusive) date range into two halves in reverse chronological order, a single day is not split."""
+    start = datetime.strptime(from_date, STANDARD_DATE_FORMAT)
+    end = datetime.strptime(to_date, STANDARD_DATE_FORMAT)
+    if end <= start:
+        return [(from_date, to_date)]
+
+    middle = start + timedelta(days=(end - start).days // 2)
+    return [
+        ((middle + timedelta(days=1)).strftime(STANDARD_DATE_FORMAT), to_date),
+        (from_date, middle.strftime(STANDARD_DATE_FORMAT))
+    ]
 
 def is_exceed_duration(cache_date_time: str, comparable_date_time: str, duration_h: int) -> bool:
     """Check if the duration is exceed between 2 ISO Datetime strings."""
@@ -39,24 +83,24 @@ def is_exceed_duration(cache_date_time: str, comparable_date_time: str, duration
 
 # Date, time formatting
 
-@singledispatch
 def get_date(date_input: Any = None) -> str:
     """Format the date input into a standard date string."""
-    if date_input is None:
-        return now().strftime(STANDARD_DATE_FORMAT)
+    if date_input is None: # Today, formatted once per day
+        return _day_to_display(date.today())[0]
+    if isinstance(date_input, datetime):
+        return date_input.strftime(STANDARD_DATE_FORMAT)
+    if isinstance(date_input, str):
+        return _standardize_date_string(date_input)
     raise NotImplementedError(f"Cannot handle type {type(date_input)}")
 
-@get_date.register(datetime)
-def _(date_obj: datetime) -> str:
-    return date_obj.strftime(STANDARD_DATE_FORMAT)
-
-@get_date.register(str)
-def _(date_str: str) -> str:
+@lru_cache(maxsize=4096)
+def _standardize_date_string(date_str: str) -> str:
+    """Validates and formats a date string (cached, as the same dates recur across renders)."""
     try:
         date_obj = datetime.strptime(date_str, STANDARD_DATE_FORMAT)
     except ValueError:
         raise ValueError(f"Invalid date string format: {date_str}")
-    return get_date(date_obj)
+    return date_obj.strftime(STANDARD_DATE_FORMAT)
 
 def get_ISO_date_time(date_obj: datetime) -> str:
     """Format the date input into an ISO date string."""
@@ -67,38 +111,29 @@ def get_ISO_date_time(date_obj: datetime) -> str:
 def unix_to_display(unix_timestamp: int) -> tuple[str, str, str]:
     """Converts a unix timestamp to a tuple of formatted date strings"""
     date_obj = datetime.fromtimestamp(unix_timestamp)
-
-    std_date = date_obj.strftime(STANDARD_DATE_FORMAT)
-    date = date_obj.strftime(DISPLAY_DATE_FORMAT)
-    time = date_obj.strftime(DISPLAY_TIME_FORMAT)
-    
+    std_date, date = _day_to_display(date_obj.date())
+    time = f"{date_obj.hour:02d}:{date_obj.minute:02d}" # DISPLAY_TIME_FORMAT
     return std_date, date, time
 
+@lru_cache(maxsize=4096)
+def _day_to_display(day: date) -> tuple[str, str]:
+    """Formats a day's standard and display date strings (cached, as many timestamps fall on the same day)."""
+    return day.strftime(STANDARD_DATE_FORMAT), day.strftime(DISPLAY_DATE_FORMAT)
+
+@lru_cache(maxsize=4096)
 def string_to_display(date_string: str) -> tuple[str, str, str]:
     """
     Converts a date string to a tuple of formatted date strings.
     """
-    date_obj = None
-    
-    formats_to_try = [
-        "%Y-%m-%d %H:%M:%S",
-        STANDARD_DATE_FORMAT,
-        ISO_DATETIME_FORMAT,
-        ISO_DATETIME_WITH_SECONDS_FORMAT 
-    ]
-    
-    for fmt in formats_to_try:
-        try:
-            date_obj = datetime.strptime(date_string, fmt)
-            break
-        except ValueError:
-            continue
-    
-    if date_obj is None:
+    parse = _PARSERS_BY_LENGTH.get(len(date_string))
+    if parse is None:
+        raise ValueError("Unsupported date format.")
+
+    try:
+        date_obj = parse(date_string)
+    except ValueError:
         raise ValueError("Unsupported date format.")
     
-    std_date = date_obj.strftime(STANDARD_DATE_FORMAT)
-    date = date_obj.strftime(DISPLAY_DATE_FORMAT)
-    time = date_obj.strftime(DISPLAY_TIME_FORMAT)
-    
-    return std_date, date, time
\ No newline at end of file
+    std_date, date = _day_to_display(date_obj.date())
+    time = f"{date_obj.hour:02d}:{date_obj.minute:02d}" # DISPLAY_TIME_FORMAT
+    return std_date, date, time
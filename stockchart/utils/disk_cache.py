@@ -0,0 +1,77 @@
+import functools
+import hashlib
+import os
+import orjson
+import threading
+import time
+from typing import Any, Callable, Optional
+
+CACHE_DIR = os.path.join("cache", "responses")
+
+_MISS = object()
+
+def memoize(expire: int, bypass: Optional[Callable[..., bool]] = None) -> Callable:
+    """
+    Caches the return values of a function on disk, keyed by its name and arguments.
+    Values are stored as JSON (like the events cache), so the function must return JSON-serializable data.
+
+    Args:
+        expire (int): Number of seconds a cached value stays fresh.
+        bypass (Callable): Called with the same arguments as the function, returns True if the cache should be skipped.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if bypass is not None and bypass(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            path = _cache_path(func, args, kwargs)
+            result = _read(path, expire)
+            if result is _MISS:
+                result = func(*args, **kwargs)
+                _write(path, result)
+            return result
+        return wrapper
+    return decorator
+
+####################
+# Helper functions #
+####################
+
+def _key_part(arg: Any) -> str:
+    """Callables (e.g. API client methods) are keyed by name, everything else by value."""
+    if callable(arg):
+        return getattr(arg, '__qualname__', getattr(arg, '__name__', repr(arg)))
+    return repr(arg)
+
+def _cache_path(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Returns the cache file path for a function call."""
+    parts = [func.__qualname__]
+    parts.extend(_key_part(arg) for arg in args)
+    parts.extend(f"{k}={_key_part(v)}" for k, v in sorted(kwargs.items()))
+    digest = hashlib.sha1("|".join(parts).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+def _read(path: str, expire: int) -> Any:
+    """Returns the cached value, or _MISS if it does not exist, is stale or unreadable."""
+    try:
+        if time.time() - os.path.getmtime(path) > expire:
+            return _MISS
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        if os.path.exists(path):
+            print(f"Error reading cache entry {path}: {e}")
+        return _MISS
+
+def _write(path: str, value: Any) -> None:
+    """Writes the value to the cache, replacing any existing entry atomically."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        data = orjson.dumps(value) # Serialized first, so a failure leaves no temp file behind
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except (OSError, orjson.JSONEncodeError) as e:
+        print(f"Error writing cache entry {path}: {e}")